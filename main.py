@@ -1,38 +1,67 @@
+import argparse
+
 from visionllm_interaction.logger.logger import get_logger
 from visionllm_interaction.exception.custom_exception import CustomException
-from visionllm_interaction.entity.config_entity import (
-    TrainingPipelineConfig,
-    DataIngestionConfig,
-)
-from visionllm_interaction.components.data_ingestion import DataIngestion
 
 logger = get_logger(__name__)
 
 
-def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="VisionLLM Interaction Analysis pipeline."
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Resolve and log the run configuration, then exit without running any stage.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """
     Entry point for VisionLLM Interaction Analysis pipeline.
 
+    Pipeline components are imported inside main() so that --help / --dry-run
+    don't pay for the stage import graph.
     """
+    args = parse_args(argv)
+
     try:
-        logger.info("=== VisionLLM Interaction Analysis: Pipeline Started ===")
+        from visionllm_interaction.entity.config_entity import (
+            TrainingPipelineConfig,
+            DataIngestionConfig,
+        )
 
         # ------------------------------------------------------------
-        # 1) Build training pipeline config (timestamped artifacts)
+        # 1) Build configs (timestamped artifacts)
         # ------------------------------------------------------------
         training_pipeline_config = TrainingPipelineConfig()
+        data_ingestion_config = DataIngestionConfig(training_pipeline_config)
+
+        if args.dry_run:
+            logger.info(
+                "Dry run: artifacts_dir=%s dataset=%s ingestion_mode=%s manifest=%s",
+                training_pipeline_config.artifact_dir,
+                data_ingestion_config.dataset_name,
+                data_ingestion_config.ingestion_mode,
+                data_ingestion_config.manifest_file_path,
+            )
+            return
+
+        logger.info("=== VisionLLM Interaction Analysis: Pipeline Started ===")
         logger.info(f"Run artifacts directory: {training_pipeline_config.artifact_dir}")
 
         # ------------------------------------------------------------
         # 2) Data Ingestion
         # ------------------------------------------------------------
-        data_ingestion_config = DataIngestionConfig(training_pipeline_config)
-
         logger.info("Starting data ingestion stage...")
         logger.info(f"Dataset: {data_ingestion_config.dataset_name}")
         logger.info(f"Ingestion mode: {data_ingestion_config.ingestion_mode}")
         logger.info(f"Dataset format: {data_ingestion_config.dataset_format}")
 
+        from visionllm_interaction.components.data_ingestion import DataIngestion
+
         data_ingestion = DataIngestion(data_ingestion_config)
         data_ingestion_artifact = data_ingestion.initiate_data_ingestion()
 
@@ -1,17 +1,28 @@
+import hashlib
+import json
 import os
+import shutil
+import tempfile
+import threading
 import zipfile
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Optional
 
-import kagglehub
+import yaml
 
 from visionllm_interaction.logger.logger import get_logger
 from visionllm_interaction.exception.custom_exception import CustomException
 from visionllm_interaction.entity.config_entity import DataIngestionConfig
 from visionllm_interaction.entity.artifact_entity import DataIngestionArtifact
+from visionllm_interaction.constants.training_pipeline import FORCE_REINGEST_ENV_VAR
 
 logger = get_logger(__name__)
 
+# Process umask, read once (os.umask can only be queried by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 
 class DataIngestion:
     """
@@ -21,9 +32,19 @@ class DataIngestion:
     Return DataIngestionArtifact
     """
 
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = ("config", "_train_dirname", "_val_dirname", "_coco_root", "_created_dirs")
+
     def __init__(self, data_ingestion_config: DataIngestionConfig):
         try:
             self.config = data_ingestion_config
+            # COCO split folder names, resolved once ("train2017", "val2017")
+            self._train_dirname = os.path.basename(self.config.raw_train_image_dir.rstrip("/"))
+            self._val_dirname = os.path.basename(self.config.raw_val_image_dir.rstrip("/"))
+            # Detected COCO root; set in register mode, where it is used in place
+            self._coco_root = None
+            # Directories already created by this instance (skip repeat makedirs walks)
+            self._created_dirs = set()
         except Exception as e:
             raise CustomException("Failed to initialize DataIngestion", e)
 
@@ -35,17 +56,237 @@ class DataIngestion:
         p = Path(path)
         return p.is_file() and p.suffix.lower() == ".zip"
 
-    @staticmethod
-    def _safe_mkdir(dir_path: str) -> None:
+    def _mark_created(self, dir_path: str) -> None:
+        """Record dir_path and its ancestors as existing."""
+        while dir_path and dir_path not in self._created_dirs:
+            self._created_dirs.add(dir_path)
+            parent = os.path.dirname(dir_path)
+            if parent == dir_path:
+                break
+            dir_path = parent
+
+    def _safe_mkdir(self, dir_path: str) -> None:
+        if dir_path in self._created_dirs:
+            return
         os.makedirs(dir_path, exist_ok=True)
+        self._mark_created(dir_path)
+
+    @staticmethod
+    def _atomic_write_bytes(path: str, buf: bytes) -> None:
+        """
+        Write buf to path atomically.
+        - Unique sibling temp file (mkstemp), so concurrent writers don't collide
+        - Loops on short writes, fsyncs, then os.replace()s over path
+        - Temp file is removed if anything fails before the replace
+        """
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path) or ".",
+            prefix=os.path.basename(path) + ".",
+            suffix=".tmp",
+        )
+        try:
+            try:
+                # os.write may write fewer bytes than asked (e.g. near ENOSPC)
+                view = memoryview(buf)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            # mkstemp creates 0600; use the mode a plain open() would have given
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _forget_created(self, root: str) -> None:
+        """Drop root and everything below it from the created-dirs set (after a removal/rename)."""
+        prefix = root.rstrip(os.sep) + os.sep
+        self._created_dirs = {
+            d for d in self._created_dirs if d != root and not d.startswith(prefix)
+        }
+
+    @staticmethod
+    def _run_in_pool(fn, jobs, max_workers: int) -> None:
+        """
+        Run fn(*job) for every job on a thread pool.
+        The first failure cancels all not-yet-started jobs and is re-raised.
+        """
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [executor.submit(fn, *job) for job in jobs]
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
+
+    def _makedirs_batch(self, dir_paths) -> None:
+        """
+        Create many (overlapping) directories.
+        Deepest paths go first, so each shared prefix is created by a single
+        os.makedirs and later prefixes are skipped via the created-dirs set.
+        """
+        for d in sorted(set(dir_paths), key=len, reverse=True):
+            self._safe_mkdir(d)
+
+    @staticmethod
+    def _batch_exists(paths) -> dict:
+        """Stat each path once and return {path: exists} (same semantics as os.path.exists)."""
+        result = {}
+        for p in paths:
+            if p in result:
+                continue
+            try:
+                os.stat(p)
+                result[p] = True
+            except (OSError, ValueError):
+                result[p] = False
+        return result
+
+    def _load_cached_download_path(self) -> Optional[str]:
+        """
+        Return the kagglehub path recorded by a previous run, if still valid.
+        - Entry is keyed by dataset name
+        - Valid only if the path exists and its top-level mtime is unchanged
+        - Ignored when FORCE_REINGEST=1
+        """
+        if os.environ.get(FORCE_REINGEST_ENV_VAR) == "1":
+            logger.info(f"{FORCE_REINGEST_ENV_VAR}=1 set; ignoring kagglehub resolution cache")
+            return None
+
+        cache_file = self.config.kagglehub_resolution_cache_file
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable kagglehub resolution cache {cache_file}: {e}")
+            return None
+
+        # Valid JSON of the wrong shape is treated as a miss, not an error
+        if not isinstance(cache, dict):
+            logger.warning(f"Ignoring malformed kagglehub resolution cache {cache_file}")
+            return None
+
+        entry = cache.get(self.config.dataset_name)
+        if not isinstance(entry, dict):
+            return None
+
+        path = entry.get("path")
+        if not isinstance(path, str):
+            return None
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+        if mtime_ns != entry.get("mtime_ns"):
+            return None
+        return path
+
+    def _save_cached_download_path(self, path: str) -> None:
+        """Record the resolved kagglehub path (+ mtime) for subsequent runs."""
+        cache_file = self.config.kagglehub_resolution_cache_file
+        try:
+            try:
+                with open(cache_file, "r", encoding="utf-8") as f:
+                    cache = json.load(f)
+            except (OSError, ValueError):
+                cache = {}
+            if not isinstance(cache, dict):
+                cache = {}
+
+            cache[self.config.dataset_name] = {
+                "path": path,
+                "mtime_ns": os.stat(path).st_mtime_ns,
+            }
+
+            self._safe_mkdir(os.path.dirname(cache_file))
+            # Atomic, so a killed run can't leave a truncated cache file
+            self._atomic_write_bytes(cache_file, json.dumps(cache, indent=2).encode("utf-8"))
+        except OSError as e:
+            # Cache is an optimisation only; never fail ingestion because of it
+            logger.warning(f"Could not write kagglehub resolution cache {cache_file}: {e}")
+
+    def _download_dataset(self) -> str:
+        """Resolve the dataset path, skipping kagglehub on a valid cache hit."""
+        cached_path = self._load_cached_download_path()
+        if cached_path:
+            logger.info(f"Using cached kagglehub path (skip download check): {cached_path}")
+            return cached_path
+
+        # Imported lazily: kagglehub pulls in requests/tqdm/auth handling at import time
+        import kagglehub
+
+        downloaded_path = kagglehub.dataset_download(self.config.dataset_name)
+        logger.info(f"Downloaded dataset to: {downloaded_path}")
+        self._save_cached_download_path(downloaded_path)
+        return downloaded_path
 
     def _extract_zip(self, zip_path: str, extract_to: str) -> str:
-        """Extract zip_path into extract_to and return extract_to."""
+        """
+        Extract zip_path into extract_to and return extract_to.
+        - Directory tree is created serially first
+        - File members are inflated concurrently; each worker thread opens its
+          own ZipFile handle since a ZipFile must not be shared across threads
+        """
         try:
             self._safe_mkdir(extract_to)
             logger.info(f"Extracting zip: {zip_path} -> {extract_to}")
+
             with zipfile.ZipFile(zip_path, "r") as zf:
-                zf.extractall(extract_to)
+                members = zf.infolist()
+
+            dst_dirs = set()
+            # Keyed by destination: repeated member names resolve last-wins,
+            # like extractall, instead of two workers writing the same file
+            file_members = {}
+            for member in members:
+                # Same sanitisation as ZipFile.extractall: drop empty/"."/".." parts
+                parts = [p for p in member.filename.split("/") if p not in ("", ".", "..")]
+                if not parts:
+                    continue
+                dst = os.path.join(extract_to, *parts)
+                if member.is_dir():
+                    dst_dirs.add(dst)
+                else:
+                    dst_dirs.add(os.path.dirname(dst))
+                    file_members.pop(dst, None)  # keep last-wins order as well
+                    file_members[dst] = member
+
+            self._makedirs_batch(dst_dirs)
+
+            buffer_size = 1 << 20  # 1 MiB
+            local = threading.local()
+            handles = []
+
+            def _extract_member(member: zipfile.ZipInfo, dst: str) -> None:
+                zf = getattr(local, "zf", None)
+                if zf is None:
+                    zf = local.zf = zipfile.ZipFile(zip_path, "r")
+                    handles.append(zf)
+                with zf.open(member) as src, open(dst, "wb", buffering=buffer_size) as out:
+                    shutil.copyfileobj(src, out, length=buffer_size)
+
+            try:
+                # First failing member (e.g. ENOSPC) cancels the remaining ones
+                self._run_in_pool(
+                    _extract_member,
+                    [(m, d) for d, m in file_members.items()],
+                    os.cpu_count() or 1,
+                )
+            finally:
+                for zf in handles:
+                    zf.close()
+
+            logger.info(f"Extracted {len(file_members)} files into: {extract_to}")
             return extract_to
         except Exception as e:
             raise CustomException("Failed to extract dataset zip", e)
@@ -56,24 +297,34 @@ class DataIngestion:
         Returns the path to the detected COCO root.
         """
         try:
-            base = Path(base_dir)
-
-            train_dirname = Path(self.config.raw_train_image_dir).name  # "train2017"
-
-            # Direct match
-            if (base / train_dirname).exists() and (base / "annotations").exists():
-                return str(base)
+            train_dirname = self._train_dirname
 
-            # Check one and two levels deep
-            candidates = (
-                [base]
-                + [p for p in base.glob("*") if p.is_dir()]
-                + [p for p in base.glob("*/*") if p.is_dir()]
-            )
+            def _is_coco_root(path: str) -> bool:
+                return os.path.isdir(os.path.join(path, train_dirname)) and os.path.isdir(
+                    os.path.join(path, "annotations")
+                )
 
-            for c in candidates:
-                if (c / train_dirname).exists() and (c / "annotations").exists():
-                    return str(c)
+            def _dir_children(path: str):
+                # DirEntry.is_dir() uses the cached d_type; no stat() per image file
+                try:
+                    with os.scandir(path) as it:
+                        for e in it:
+                            if e.is_dir():
+                                yield e.path
+                except OSError:
+                    return
+
+            def _candidates():
+                # Breadth-first and lazy: depth 2 is only scanned if depth 0/1 don't match
+                yield base_dir
+                level1 = list(_dir_children(base_dir))
+                yield from level1
+                for d1 in level1:
+                    yield from _dir_children(d1)
+
+            for c in _candidates():
+                if _is_coco_root(c):
+                    return c
 
             raise CustomException(
                 f"Could not locate COCO root under: {base_dir}. "
@@ -84,35 +335,122 @@ class DataIngestion:
         except Exception as e:
             raise CustomException("Failed while locating COCO root directory", e)
 
+    @staticmethod
+    def _link_or_copy(src: str, dst: str) -> None:
+        """
+        Hardlink src to dst, falling back to a byte copy.
+        - os.link only adds an inode reference (no data movement)
+        - Cross-device / unsupported links fall back to shutil.copy2, which uses
+          sendfile on Linux and clonefile/fcopyfile on macOS
+        """
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
+
     def _copytree_if_missing(self, src: str, dst: str) -> None:
-        """Copy a directory tree if dst doesn't exist."""
+        """
+        Clone a directory tree (hardlink first) if dst doesn't exist.
+        - Walk src once with os.scandir, collecting dirs and (src, dst) file pairs
+        - Create the directory tree up front so workers never race on makedirs
+        - Link/copy files concurrently on a thread pool (I/O releases the GIL)
+        - Stage into dst + ".partial" and rename on success, so a failed run
+          never leaves a half-populated dst that later runs would skip
+        """
         if os.path.exists(dst):
             logger.info(f"Raw path already exists (skip copy): {dst}")
             return
-        import shutil
 
-        logger.info(f"Copying: {src} -> {dst}")
-        shutil.copytree(src, dst)
+        logger.info(f"Linking/copying: {src} -> {dst}")
+
+        staging = dst + ".partial"
+        if os.path.exists(staging):
+            logger.info(f"Removing leftover partial copy: {staging}")
+            shutil.rmtree(staging)
+            self._forget_created(staging)
+
+        dst_dirs = [staging]
+        file_pairs = []
+        stack = [(src, staging)]
+        while stack:
+            src_dir, dst_dir = stack.pop()
+            with os.scandir(src_dir) as it:
+                for entry in it:
+                    dst_path = os.path.join(dst_dir, entry.name)
+                    if entry.is_dir():
+                        dst_dirs.append(dst_path)
+                        stack.append((entry.path, dst_path))
+                    else:
+                        file_pairs.append((entry.path, dst_path))
+
+        try:
+            self._makedirs_batch(dst_dirs)
+
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            self._run_in_pool(self._link_or_copy, file_pairs, max_workers)
+
+            os.rename(staging, dst)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        finally:
+            self._forget_created(staging)
+        self._mark_created(dst)
+
+        logger.info(f"Linked/copied {len(file_pairs)} files into: {dst}")
 
     def _copyfile_if_missing(self, src: str, dst: str) -> None:
-        """Copy a file if dst doesn't exist."""
+        """Clone a file (hardlink first) if dst doesn't exist."""
         if os.path.exists(dst):
             logger.info(f"Raw file already exists (skip copy): {dst}")
             return
-        import shutil
 
         self._safe_mkdir(os.path.dirname(dst))
-        logger.info(f"Copying: {src} -> {dst}")
-        shutil.copy2(src, dst)
+        logger.info(f"Linking/copying: {src} -> {dst}")
+        self._link_or_copy(src, dst)
 
-    def _prepare_raw_data_dir(self, downloaded_path: str) -> None:
+    def _raw_paths(self) -> dict:
+        """
+        Raw dataset paths handed to downstream stages.
+        - register: paths inside the detected COCO root (kagglehub cache, used in place)
+        - copy: staged paths under config.raw_data_dir
         """
-        Ensures config.raw_data_dir contains the expected COCO train/val + annotations.
+        if self.config.ingestion_mode == "register" and self._coco_root:
+            ann_dir = os.path.join(self._coco_root, "annotations")
+            return {
+                "train_images": os.path.join(self._coco_root, self._train_dirname),
+                "val_images": os.path.join(self._coco_root, self._val_dirname),
+                "annotation_dir": ann_dir,
+                "train_annotation": os.path.join(
+                    ann_dir, os.path.basename(self.config.raw_train_annotation_file)
+                ),
+                "val_annotation": os.path.join(
+                    ann_dir, os.path.basename(self.config.raw_val_annotation_file)
+                ),
+            }
+
+        return {
+            "train_images": self.config.raw_train_image_dir,
+            "val_images": self.config.raw_val_image_dir,
+            "annotation_dir": self.config.raw_annotation_dir,
+            "train_annotation": self.config.raw_train_annotation_file,
+            "val_annotation": self.config.raw_val_annotation_file,
+        }
+
+    def _prepare_raw_data_dir(self, downloaded_path: str) -> set:
+        """
+        Ensures the expected COCO train/val + annotations are available.
         - If downloaded_path is a zip, extract it into scratch temp
         - Locate COCO root
-        - Copy only required dirs/files into raw_data_dir (train2017, val2017 if present, annotations/)
+        - register mode: reference the COCO root in place (no copy)
+        - copy mode: copy only required dirs/files into raw_data_dir (train2017, val2017 if present, annotations/)
+        Returns the set of raw paths confirmed to exist (reused by _validate_raw_paths).
         """
         try:
+            mode = self.config.ingestion_mode
+            if mode not in ("register", "copy"):
+                raise CustomException(f"Unsupported ingestion mode: {mode}")
+
             # Ensure scratch raw root exists
             self._safe_mkdir(self.config.raw_data_dir)
 
@@ -125,81 +463,110 @@ class DataIngestion:
             coco_root = self._find_coco_root(working_dir)
             logger.info(f"Detected COCO root: {coco_root}")
 
-            train_dirname = Path(self.config.raw_train_image_dir).name  # train2017
-            val_dirname = Path(self.config.raw_val_image_dir).name      # val2017
+            train_dirname = self._train_dirname
+            val_dirname = self._val_dirname
 
             src_train = os.path.join(coco_root, train_dirname)
             src_val = os.path.join(coco_root, val_dirname)
             src_ann_dir = os.path.join(coco_root, "annotations")
 
-            # Destination (on /scratch)
-            dst_train = self.config.raw_train_image_dir
-            dst_val = self.config.raw_val_image_dir
-            dst_ann_dir = self.config.raw_annotation_dir
+            src_exists = self._batch_exists([src_train, src_ann_dir, src_val])
 
             # ---- Required: train + annotations ----
-            if not os.path.exists(src_train):
+            if not src_exists[src_train]:
                 raise CustomException(f"Missing expected folder in dataset: {src_train}")
-            if not os.path.exists(src_ann_dir):
+            if not src_exists[src_ann_dir]:
                 raise CustomException(f"Missing expected folder in dataset: {src_ann_dir}")
 
-            # Copy only train2017
-            self._copytree_if_missing(src_train, dst_train)
-
-            # Copy val2017 only if present 
-            if os.path.exists(src_val):
-                self._copytree_if_missing(src_val, dst_val)
+            if mode == "register":
+                # Use the dataset where it already lives
+                self._coco_root = coco_root
+                logger.info(f"Registered COCO root in place (no copy): {coco_root}")
             else:
-                logger.warning(f"val images folder not found at: {src_val} (continuing)")
+                # Destination (on /scratch)
+                dst_train = self.config.raw_train_image_dir
+                dst_val = self.config.raw_val_image_dir
+                dst_ann_dir = self.config.raw_annotation_dir
+
+                # Copy only train2017
+                self._copytree_if_missing(src_train, dst_train)
+
+                # Copy val2017 only if present
+                if src_exists[src_val]:
+                    self._copytree_if_missing(src_val, dst_val)
+                else:
+                    logger.warning(f"val images folder not found at: {src_val} (continuing)")
 
-            # Copy annotations directory (contains instances_*.json etc.)
-            self._copytree_if_missing(src_ann_dir, dst_ann_dir)
+                # Copy annotations directory (contains instances_*.json etc.)
+                self._copytree_if_missing(src_ann_dir, dst_ann_dir)
+
+            paths = self._raw_paths()
+            exists = self._batch_exists(paths.values())
 
             # ---- Ensure required annotation exists (train) ----
-            if not os.path.exists(self.config.raw_train_annotation_file):
+            if not exists[paths["train_annotation"]]:
                 raise CustomException(
-                    f"Train annotation file not found after staging: {self.config.raw_train_annotation_file}"
+                    f"Train annotation file not found after staging: {paths['train_annotation']}"
                 )
 
             # Warn if val annotation is missing
-            if not os.path.exists(self.config.raw_val_annotation_file):
+            if not exists[paths["val_annotation"]]:
                 logger.warning(
-                    f"Val annotation file not found after staging: {self.config.raw_val_annotation_file} (continuing)"
+                    f"Val annotation file not found after staging: {paths['val_annotation']} (continuing)"
                 )
 
-            logger.info("Raw COCO train/val data prepared under: %s", self.config.raw_data_dir)
+            logger.info("Raw COCO train/val data prepared (%s mode) at: %s", mode, paths["train_images"])
+
+            known_exists = {p for p, ok in exists.items() if ok}
+            known_exists.add(self.config.raw_data_dir)
+            return known_exists
 
         except CustomException:
             raise
         except Exception as e:
             raise CustomException("Failed to prepare raw COCO directory", e)
 
-    def _validate_raw_paths(self) -> None:
-        """Validate that required raw paths exist."""
+    def _validate_raw_paths(self, known_exists: Optional[set] = None) -> None:
+        """
+        Validate that required raw paths exist.
+        Paths in known_exists (already confirmed by _prepare_raw_data_dir) are not re-checked.
+        """
         try:
+            known_exists = known_exists or set()
+            paths = self._raw_paths()
             required_dirs = [
                 self.config.raw_data_dir,
-                self.config.raw_train_image_dir,
-                self.config.raw_annotation_dir,
+                paths["train_images"],
+                paths["annotation_dir"],
             ]
             required_files = [
-                self.config.raw_train_annotation_file,
+                paths["train_annotation"],
             ]
 
+            optional_paths = [paths["val_images"], paths["val_annotation"]]
+
+            exists = dict.fromkeys(known_exists, True)
+            exists.update(
+                self._batch_exists(
+                    p for p in required_dirs + required_files + optional_paths
+                    if p not in known_exists
+                )
+            )
+
             for d in required_dirs:
-                if not os.path.exists(d):
+                if not exists[d]:
                     raise CustomException(f"Required directory does not exist: {d}")
 
             for f in required_files:
-                if not os.path.exists(f):
+                if not exists[f]:
                     raise CustomException(f"Required file does not exist: {f}")
 
             #  warnings
-            if not os.path.exists(self.config.raw_val_image_dir):
-                logger.warning(f"Validation: val image dir missing: {self.config.raw_val_image_dir}")
+            if not exists[paths["val_images"]]:
+                logger.warning(f"Validation: val image dir missing: {paths['val_images']}")
 
-            if not os.path.exists(self.config.raw_val_annotation_file):
-                logger.warning(f"Validation: val annotation file missing: {self.config.raw_val_annotation_file}")
+            if not exists[paths["val_annotation"]]:
+                logger.warning(f"Validation: val annotation file missing: {paths['val_annotation']}")
 
             logger.info("Raw path validation completed.")
 
@@ -208,33 +575,136 @@ class DataIngestion:
         except Exception as e:
             raise CustomException("Failed to validate raw dataset paths", e)
 
+    @staticmethod
+    def _annotation_digest(annotation_dir: str) -> str:
+        """blake2b over the sorted (name, size) listing of the annotations dir (no file reads)."""
+        with os.scandir(annotation_dir) as it:
+            listing = sorted(
+                (e.name, e.stat().st_size) for e in it if e.is_file()
+            )
+        h = hashlib.blake2b(digest_size=16)
+        for name, size in listing:
+            h.update(f"{name}\0{size}\n".encode("utf-8"))
+        return h.hexdigest()
+
+    def _load_ingestion_marker(self, downloaded_path: str) -> Optional[set]:
+        """
+        Check the sidecar written by a previous successful ingestion.
+        - Must match the current mode and kagglehub path
+        - Annotation digest is recomputed and must match
+        - Required raw paths (image/annotation dirs, train annotation) must still exist
+        - Ignored when FORCE_REINGEST=1
+        On a hit, restores the registered COCO root and returns the set of raw
+        paths confirmed to exist (reused by _validate_raw_paths); otherwise None.
+        """
+        if os.environ.get(FORCE_REINGEST_ENV_VAR) == "1":
+            return None
+
+        marker_file = self.config.ingestion_marker_file
+        try:
+            with open(marker_file, "r", encoding="utf-8") as f:
+                marker = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable ingestion marker {marker_file}: {e}")
+            return None
+
+        # Valid JSON of the wrong shape is treated as a miss, not an error
+        if not isinstance(marker, dict):
+            logger.warning(f"Ignoring malformed ingestion marker {marker_file}")
+            return None
+
+        if (
+            marker.get("ingestion_mode") != self.config.ingestion_mode
+            or marker.get("downloaded_path") != downloaded_path
+        ):
+            return None
+
+        coco_root = marker.get("coco_root")
+        if self.config.ingestion_mode == "register":
+            if not coco_root or not isinstance(coco_root, str):
+                return None
+            annotation_dir = os.path.join(coco_root, "annotations")
+        else:
+            annotation_dir = self.config.raw_annotation_dir
+
+        try:
+            digest = self._annotation_digest(annotation_dir)
+        except OSError:
+            return None
+        if digest != marker.get("annotation_digest"):
+            return None
+
+        if self.config.ingestion_mode == "register":
+            self._coco_root = coco_root
+
+        # Staged/registered data may have been removed since the marker was written
+        paths = self._raw_paths()
+        required = [
+            self.config.raw_data_dir,
+            paths["train_images"],
+            paths["annotation_dir"],
+            paths["train_annotation"],
+        ]
+        exists = self._batch_exists(required)
+        missing = [p for p in required if not exists[p]]
+        if missing:
+            logger.info(f"Ingestion marker matches but raw paths are missing (re-staging): {missing}")
+            self._coco_root = None
+            return None
+
+        return set(required)
+
+    def _write_ingestion_marker(self, downloaded_path: str) -> None:
+        """Record a successful ingestion (mode, paths, annotation digest)."""
+        marker_file = self.config.ingestion_marker_file
+        try:
+            marker = {
+                "ingestion_mode": self.config.ingestion_mode,
+                "downloaded_path": downloaded_path,
+                "coco_root": self._coco_root,
+                "annotation_digest": self._annotation_digest(self._raw_paths()["annotation_dir"]),
+            }
+            # Atomic, so a killed run can't leave a truncated marker
+            self._atomic_write_bytes(marker_file, json.dumps(marker, indent=2).encode("utf-8"))
+        except OSError as e:
+            # Marker is an optimisation only; never fail ingestion because of it
+            logger.warning(f"Could not write ingestion marker {marker_file}: {e}")
+
     def _write_manifest(self) -> None:
         """Write YAML manifest consumed by downstream stages."""
+        from datetime import datetime
+
         try:
             self._safe_mkdir(self.config.data_ingestion_dir)
 
             manifest_path = self.config.manifest_file_path
+            paths = self._raw_paths()
             created_at = datetime.now().isoformat()
 
-            
-            yaml_text = f"""dataset_name: "{self.config.dataset_name}"
-dataset_format: "{self.config.dataset_format}"
-created_at: "{created_at}"
-
-ingestion:
-  mode: "{self.config.ingestion_mode}"
-
-paths:
-  train_images: "{self.config.raw_train_image_dir}"
-  val_images: "{self.config.raw_val_image_dir}"
-
-annotations:
-  train: "{self.config.raw_train_annotation_file}"
-  val: "{self.config.raw_val_annotation_file}"
-"""
-
-            with open(manifest_path, "w", encoding="utf-8") as f:
-                f.write(yaml_text)
+            manifest = {
+                "dataset_name": self.config.dataset_name,
+                "dataset_format": self.config.dataset_format,
+                "created_at": created_at,
+                "ingestion": {
+                    "mode": self.config.ingestion_mode,
+                },
+                "paths": {
+                    "train_images": paths["train_images"],
+                    "val_images": paths["val_images"],
+                },
+                "annotations": {
+                    "train": paths["train_annotation"],
+                    "val": paths["val_annotation"],
+                },
+            }
+            # safe_dump handles quoting/escaping of arbitrary path strings
+            buf = yaml.safe_dump(manifest, sort_keys=False).encode("utf-8")
+
+            # Raw bytes (no text codec layer), written atomically so readers
+            # never see a partial YAML
+            self._atomic_write_bytes(manifest_path, buf)
 
             logger.info(f"Wrote data manifest: {manifest_path}")
 
@@ -253,25 +723,33 @@ annotations:
             self._safe_mkdir(self.config.data_ingestion_dir)
 
             #  Download dataset (kagglehub cache path)
-            downloaded_path = kagglehub.dataset_download(self.config.dataset_name)
-            logger.info(f"Downloaded dataset to: {downloaded_path}")
+            downloaded_path = self._download_dataset()
 
-            # Prepare raw data directory (on /scratch via constants)
-            self._prepare_raw_data_dir(downloaded_path)
+            # Prepare raw data directory (on /scratch via constants),
+            # unless a previous run already did so for this exact dataset
+            known_exists = self._load_ingestion_marker(downloaded_path)
+            if known_exists is not None:
+                logger.info("Ingestion marker matches; skipping COCO root detection and staging")
+            else:
+                known_exists = self._prepare_raw_data_dir(downloaded_path)
+                self._write_ingestion_marker(downloaded_path)
 
             #  Validate raw paths
-            self._validate_raw_paths()
+            self._validate_raw_paths(known_exists)
 
             #  Write manifest into artifacts/<timestamp>/data_ingestion/
             self._write_manifest()
 
             logger.info("===== Data Ingestion Completed Successfully =====")
 
+            paths = self._raw_paths()
             return DataIngestionArtifact(
                 data_ingestion_dir=self.config.data_ingestion_dir,
                 manifest_file_path=self.config.manifest_file_path,
                 ingestion_mode=self.config.ingestion_mode,
                 dataset_format=self.config.dataset_format,
+                train_annotation_file=paths["train_annotation"],
+                val_annotation_file=paths["val_annotation"],
             )
 
         except CustomException:
@@ -18,7 +18,9 @@ TRAINING_PIPELINE_NAME: str = "visionllm_interaction_pipeline"
 
 DATA_INGESTION_DIR_NAME: str = "data_ingestion"
 
-# Ingestion strategy (e.g. register | download | local)
+# Ingestion strategy:
+#   register -> reference the kagglehub cache in place (no copy)
+#   copy     -> stage train/val/annotations into RAW_DATA_DIR (e.g. air-gapped runs)
 DATA_INGESTION_MODE: str = "register"
 
 
@@ -55,6 +57,18 @@ RAW_COCO_VAL_ANN_FILE: str = (
     f"{RAW_COCO_ANNOTATION_DIR}/instances_val2017.json"
 )
 
+# Cached kagglehub resolution (dataset -> local cache path), reused across runs
+KAGGLEHUB_RESOLUTION_CACHE_FILE: str = (
+    f"{RAW_DATA_DIR}/.cache/kagglehub_resolution.json"
+)
+
+# Sidecar written after a successful ingestion (annotation digest + COCO root);
+# lets later runs skip COCO root detection and staging
+RAW_INGESTION_MARKER_FILE: str = f"{RAW_DATA_DIR}/.ingestion_ok"
+
+# Set to "1" to ignore cached ingestion state and re-run kagglehub
+FORCE_REINGEST_ENV_VAR: str = "FORCE_REINGEST"
+
 
 # ==================================================
 # DATA INGESTION ARTIFACTS
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+from visionllm_interaction.utils.main_utils import load_json
+
 
 @dataclass
 class DataIngestionArtifact:
@@ -8,9 +10,16 @@ class DataIngestionArtifact:
 
     - Points to the ingestion manifest file created
     - Records dataset format and ingestion mode
+    - Points to the resolved COCO annotation files
     """
 
     data_ingestion_dir: str
     manifest_file_path: str
     ingestion_mode: str
     dataset_format: str  # e.g. "raw"
+    train_annotation_file: str
+    val_annotation_file: str
+
+    def load_train_annotations(self) -> dict:
+        """Parse the COCO train annotation JSON (mmap + orjson)."""
+        return load_json(self.train_annotation_file)
@@ -1,5 +1,7 @@
 import os
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime
+from typing import Optional
 
 from visionllm_interaction.constants.training_pipeline import (
     ARTIFACTS_DIR,
@@ -14,25 +16,39 @@ from visionllm_interaction.constants.training_pipeline import (
     RAW_COCO_VAL_ANN_FILE,
     DATA_INGESTION_MANIFEST_FILE,
     DATASET_NAME,
+    KAGGLEHUB_RESOLUTION_CACHE_FILE,
+    RAW_INGESTION_MARKER_FILE,
 )
 
 
+@dataclass(frozen=True, slots=True)
 class TrainingPipelineConfig:
     """
     Global training pipeline configuration.
     Creates a timestamped artifact directory for each run.
+    Frozen + slotted: built once per run, no per-instance __dict__.
     """
 
-    def __init__(self, timestamp: datetime = datetime.now()):
-        timestamp_str = timestamp.strftime("%m_%d_%Y_%H_%M_%S")
+    # Run start time; defaults to now (resolved per instance, not at import time)
+    timestamp: InitVar[Optional[datetime]] = None
+
+    pipeline_name: str = TRAINING_PIPELINE_NAME
+    artifact_name: str = ARTIFACTS_DIR
 
-        self.pipeline_name: str = TRAINING_PIPELINE_NAME
-        self.artifact_name: str = ARTIFACTS_DIR
-        self.artifact_dir: str = os.path.join(self.artifact_name, timestamp_str)
+    # Derived in __post_init__
+    artifact_dir: str = field(init=False)
+    timestamp_str: str = field(init=False)  # e.g. "01_31_2026_14_05_09"
+
+    def __post_init__(self, timestamp: Optional[datetime]):
+        timestamp = timestamp or datetime.now()
+        timestamp_str = timestamp.strftime("%m_%d_%Y_%H_%M_%S")
 
-        self.timestamp: str = timestamp_str
+        # Frozen dataclass: assign derived fields through object.__setattr__
+        object.__setattr__(self, "timestamp_str", timestamp_str)
+        object.__setattr__(self, "artifact_dir", os.path.join(self.artifact_name, timestamp_str))
 
 
+@dataclass(frozen=True, slots=True)
 class DataIngestionConfig:
     """
     Configuration for Data Ingestion stage.
@@ -41,36 +57,46 @@ class DataIngestionConfig:
     - Defines where ingestion artifacts (manifest) are written (inside artifacts/<timestamp>/data_ingestion)
     """
 
-    def __init__(self, training_pipeline_config: TrainingPipelineConfig):
-        
-        self.dataset_name: str = DATASET_NAME
-        self.ingestion_mode: str = DATA_INGESTION_MODE
-        self.dataset_format: str = "raw"  
+    training_pipeline_config: InitVar[TrainingPipelineConfig]
 
-        # -----------------------------
-        # Artifact directory for stage
-        # -----------------------------
-        self.data_ingestion_dir: str = os.path.join(
-            training_pipeline_config.artifact_dir,
-            DATA_INGESTION_DIR_NAME,
-        )
+    dataset_name: str = DATASET_NAME
+    ingestion_mode: str = DATA_INGESTION_MODE
+    dataset_format: str = "raw"
 
-        # -----------------------------
-        # RAW COCO dataset paths (on /scratch)
-        # -----------------------------
-        self.raw_data_dir: str = RAW_DATA_DIR
+    # -----------------------------
+    # RAW COCO dataset paths (on /scratch)
+    # -----------------------------
+    raw_data_dir: str = RAW_DATA_DIR
 
-        self.raw_train_image_dir: str = RAW_COCO_TRAIN_IMAGE_DIR
-        self.raw_val_image_dir: str = RAW_COCO_VAL_IMAGE_DIR
+    raw_train_image_dir: str = RAW_COCO_TRAIN_IMAGE_DIR
+    raw_val_image_dir: str = RAW_COCO_VAL_IMAGE_DIR
 
-        self.raw_annotation_dir: str = RAW_COCO_ANNOTATION_DIR
-        self.raw_train_annotation_file: str = RAW_COCO_TRAIN_ANN_FILE
-        self.raw_val_annotation_file: str = RAW_COCO_VAL_ANN_FILE
+    raw_annotation_dir: str = RAW_COCO_ANNOTATION_DIR
+    raw_train_annotation_file: str = RAW_COCO_TRAIN_ANN_FILE
+    raw_val_annotation_file: str = RAW_COCO_VAL_ANN_FILE
+
+    # kagglehub resolution cache (skip the downloader on unchanged cache hits)
+    kagglehub_resolution_cache_file: str = KAGGLEHUB_RESOLUTION_CACHE_FILE
+
+    # Successful-ingestion sidecar (skip root detection/staging on re-runs)
+    ingestion_marker_file: str = RAW_INGESTION_MARKER_FILE
+
+    # -----------------------------
+    # Derived in __post_init__: artifact dir + manifest output
+    # -----------------------------
+    data_ingestion_dir: str = field(init=False)
+    manifest_file_path: str = field(init=False)
+
+    def __post_init__(self, training_pipeline_config: TrainingPipelineConfig):
+        data_ingestion_dir = os.path.join(
+            training_pipeline_config.artifact_dir,
+            DATA_INGESTION_DIR_NAME,
+        )
 
-        # -----------------------------
-        # Ingestion artifact output
-        # -----------------------------
-        self.manifest_file_path: str = os.path.join(
-            self.data_ingestion_dir,
-            DATA_INGESTION_MANIFEST_FILE,
+        # Frozen dataclass: assign derived fields through object.__setattr__
+        object.__setattr__(self, "data_ingestion_dir", data_ingestion_dir)
+        object.__setattr__(
+            self,
+            "manifest_file_path",
+            os.path.join(data_ingestion_dir, DATA_INGESTION_MANIFEST_FILE),
         )
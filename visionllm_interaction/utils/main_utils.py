@@ -0,0 +1,25 @@
+import mmap
+import os
+
+import orjson
+
+from visionllm_interaction.exception.custom_exception import CustomException
+
+
+def load_json(file_path: str):
+    """
+    Load a (potentially large) JSON file, e.g. COCO instances_*.json.
+    - Memory-maps the file read-only instead of read() into a Python buffer
+    - Parses the mapped bytes with orjson (no intermediate copy)
+    """
+    try:
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap cannot map an empty file; let the parser report it
+                return orjson.loads(b"")
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+    except Exception as e:
+        raise CustomException(f"Failed to load JSON file: {file_path}", e)